@@ -6,8 +6,37 @@ Natural conversation flow without interrupting prompts
 """
 
 import ollama
+import os
+import re
+import sys
 import time
+import queue
+import threading
+import hashlib
+import json
+import importlib.util
+import concurrent.futures
+from collections import OrderedDict
 from datetime import datetime
+from pathlib import Path
+from types import MappingProxyType
+
+# Separator line used between sections of console output
+BANNER = "=" * 50
+
+# Whole answers that control a practice session instead of being graded
+SKIP_CMDS = frozenset({'next question', 'next', 'skip'})
+STOP_CMDS = frozenset({'finish', 'stop', 'quit', 'done'})
+REPEAT_Q_CMDS = frozenset({'repeat question', 'repeat', 'again'})
+CONTROL_CMDS = SKIP_CMDS | STOP_CMDS
+END_CONVERSATION_CMDS = STOP_CMDS | {'goodbye'}
+
+# Optional sentence embeddings for matching reworded answers; the library is
+# heavy to import, so it is only loaded in the background when installed
+EMBEDDINGS_AVAILABLE = importlib.util.find_spec("sentence_transformers") is not None
+
+# Optional local speech recognition with faster-whisper instead of Google's web API
+WHISPER_AVAILABLE = importlib.util.find_spec("faster_whisper") is not None
 
 # Try to import speech libraries
 try:
@@ -19,70 +48,315 @@ except ImportError:
     SPEECH_AVAILABLE = False
     print("📝 Speech libraries not installed. Please install: pip3 install speechrecognition pyttsx3 pyaudio")
 
+# Seconds to trust the cached Ollama model list before querying again
+MODELS_CACHE_TTL = 60
+
+# How long Ollama keeps the model loaded between requests; -1 keeps it
+# resident for the whole session so feedback never waits on a reload
+OLLAMA_KEEP_ALIVE = -1
+
+# Context window for every request. It must be the same on each call, or
+# Ollama reloads the model and drops its prompt cache
+OLLAMA_NUM_CTX = 4096
+
+# Feedback turns sent to Ollama before older ones are summarized, and how
+# many of the most recent turns are always kept word for word
+MAX_HISTORY_TURNS = 6
+HISTORY_TURNS_KEPT = 3
+
+# Feedback cache size and how many SimHash bits a near-duplicate answer may differ by
+FEEDBACK_CACHE_SIZE = 128
+SIMHASH_MAX_DISTANCE = 6
+
+# Longest answer (in words) that may reuse feedback written for a near-duplicate;
+# in longer answers a one-word grammar slip barely moves the fingerprint
+NEAR_DUPLICATE_MAX_WORDS = 4
+
+# Whisper model used for local speech recognition, and the no-speech
+# probability above which a decoded segment is treated as noise
+WHISPER_MODEL = "small.en"
+WHISPER_MAX_NO_SPEECH_PROB = 0.6
+
+# Embedding model and the cosine similarity a reworded answer needs to reuse feedback
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+EMBEDDING_MIN_SIMILARITY = 0.92
+
+# Seconds before the microphone is re-calibrated for ambient noise
+AMBIENT_RECALIBRATE_SECONDS = 300
+
+# Silence (seconds) that ends a speech segment, extra silence that ends the
+# whole answer, and the longest answer recorded. Learners often pause for
+# most of a second mid-sentence, so a segment only ends at a longer pause
+SEGMENT_PAUSE = 0.8
+ANSWER_PAUSE = 0.5
+ANSWER_TIME_LIMIT = 120
+
+# Optional local neural TTS server, offered when the URL is set. It speaks the
+# Piper HTTP server API (python -m piper.http_server): a POSTed {"text", "voice"}
+# returns 16-bit PCM WAV audio; the voice is left to the server unless given
+NEURAL_TTS_URL = os.environ.get("SPEAKBOT_TTS_URL")
+NEURAL_TTS_VOICE = os.environ.get("SPEAKBOT_TTS_VOICE")
+
+# Rendered system-voice audio is kept on disk here and the newest few in memory
+SPEECH_CACHE_DIR = Path("~/.cache/speakbot").expanduser()
+SPEECH_CACHE_SIZE = 32
+
+# Lines rendered per pass of the system voice; speech that comes in while
+# rendering only waits for the current pass
+RENDER_BATCH_SIZE = 4
+
+# Tutor conversation saved on exit and picked up again on the next run
+SESSION_FILE = SPEECH_CACHE_DIR / "session.json"
+
+# Maximum number of prefetched or recently played TTS chunks kept in memory
+# (room for a full drill set)
+TTS_PREFETCH_SIZE = 24
+
+# Sentence boundaries used to chunk text and hand streamed feedback to TTS.
+# Line breaks count too (feedback is often a list), but "1." list markers don't
+SENTENCE_BREAK = re.compile(r'(?<=[.!?])(?<!\d\.)\s+|\s*\n\s*')
+
+# Voice name/id patterns for picking native English voices and their accents
+NATIVE_VOICE_RE = re.compile(
+    r'english|en-us|en-gb|en-au'            # Language codes
+    r'|american|british|australian'         # Accents
+    r'|hazel|karen|daniel|samantha'         # macOS voices
+    r'|david|zira|mark|susan'               # Windows voices
+    r'|native|natural|premium'              # Quality indicators
+)
+US_RE = re.compile(r'us|american|zira|david|hazel')
+UK_RE = re.compile(r'gb|british|uk|daniel|kate')
+AU_RE = re.compile(r'au|australian|karen|lee')
+
+# Practice topics for seamless conversation, shared read-only by every bot
+PRACTICE_TOPICS = MappingProxyType({
+    "beginner": MappingProxyType({
+        "personal": (
+            "Tell me about yourself and where you're from",
+            "What do you do for work or study?",
+            "Describe your family to me",
+            "What are your favorite hobbies?",
+            "Tell me about a typical day in your life"
+        ),
+        "situations": (
+            "You're at a restaurant ordering food. Show me how you'd order your favorite meal",
+            "You need directions to the nearest bank. Ask me for help",
+            "You're meeting a new coworker. Introduce yourself",
+            "You're shopping for clothes. Ask about sizes and prices",
+            "You want to invite a friend for coffee. Make the invitation"
+        )
+    }),
+    "intermediate": (
+        "Tell me about a memorable trip you took",
+        "Describe a challenge you faced and how you solved it",
+        "What's a skill you'd like to learn and why?",
+        "Tell me about someone who has influenced your life",
+        "Describe your ideal weekend",
+        "What's your opinion on working from home?",
+        "How has technology changed your daily life?",
+        "What's the best advice you've ever received?"
+    ),
+    "advanced": (
+        "What's your perspective on social media's impact on society?",
+        "How do you think education will change in the next 10 years?",
+        "Discuss the balance between work and personal life",
+        "What role should governments play in environmental protection?",
+        "How can we address inequality in society?",
+        "What would you do if you were the leader of your country for a day?",
+        "Discuss the advantages and disadvantages of globalization",
+        "How might artificial intelligence change our future?"
+    )
+})
+
+# Fixed lines the tutor speaks, rendered ahead of time for the system voice
+WELCOME_MESSAGE = "Welcome to seamless English speaking practice! I'll automatically speak questions and feedback, and show you exactly what I heard you say. Let's start!"
+FAREWELL_MESSAGE = "Thanks for practicing English speaking with me! Keep up the great work!"
+PRACTICE_GREETING = "Hi! I'm your English conversation partner. Let's practice speaking naturally. I'll ask you questions one by one, listen carefully to your answers, and give you helpful feedback."
+FREE_CONVERSATION_GREETING = "Let's have a free conversation! Talk about anything you want - your day, your thoughts, your dreams. I'm here to listen and help you practice English naturally."
+DRILL_INTRO = "Let's practice some challenging English sounds. I'll say a word, then you repeat it. Ready?"
+DRILL_PERFECT = "Perfect! Great pronunciation."
+DRILL_SOUND_INTRO = "Now let's practice {sound}. Listen and repeat each word."
+FREE_CONVERSATION_TOPIC = "free conversation"
+STATIC_UTTERANCES = (
+    WELCOME_MESSAGE, FAREWELL_MESSAGE, PRACTICE_GREETING,
+    FREE_CONVERSATION_GREETING, DRILL_INTRO, DRILL_PERFECT
+)
+
+# First lines each menu choice speaks, prepared while the menu is on screen
+MODE_OPENING_LINES = (
+    PRACTICE_GREETING, FREE_CONVERSATION_GREETING, DRILL_INTRO,
+    PRACTICE_TOPICS["beginner"]["personal"][0],
+    PRACTICE_TOPICS["beginner"]["situations"][0],
+    PRACTICE_TOPICS["intermediate"][0],
+    PRACTICE_TOPICS["advanced"][0]
+)
+
+def normalize_response(text):
+    """Lowercase text and collapse punctuation/whitespace for cache lookups"""
+    return re.sub(r'\W+', ' ', text.lower()).strip()
+
+def simhash(text):
+    """64-bit SimHash of the character trigrams in text"""
+    padded = f"  {text}  "
+    weights = [0] * 64
+    for i in range(len(padded) - 2):
+        digest = hashlib.blake2b(padded[i:i + 3].encode(), digest_size=8).digest()
+        value = int.from_bytes(digest, 'big')
+        for bit in range(64):
+            weights[bit] += 1 if value >> bit & 1 else -1
+    return sum(1 << bit for bit in range(64) if weights[bit] > 0)
+
+def parse_wav_header(data):
+    """Return (sample rate, channels, header length) of 16-bit PCM WAV data, or None if more bytes are needed"""
+    if len(data) < 12:
+        return None
+    if data[:4] != b"RIFF" or data[8:12] != b"WAVE":
+        raise ValueError("the neural voice server did not return WAV audio")
+    
+    fmt = None
+    pos = 12
+    while pos + 8 <= len(data):
+        chunk_id = data[pos:pos + 4]
+        size = int.from_bytes(data[pos + 4:pos + 8], 'little')
+        if chunk_id == b"data":
+            if fmt is None:
+                raise ValueError("WAV audio has no format chunk")
+            return (*fmt, pos + 8)
+        if chunk_id == b"fmt ":
+            if pos + 24 > len(data):
+                return None
+            channels = int.from_bytes(data[pos + 10:pos + 12], 'little')
+            rate = int.from_bytes(data[pos + 12:pos + 16], 'little')
+            bits = int.from_bytes(data[pos + 22:pos + 24], 'little')
+            if bits != 16:
+                raise ValueError(f"unsupported {bits}-bit WAV audio")
+            fmt = (rate, channels)
+        pos += 8 + size + (size & 1)  # Chunks are padded to an even length
+    return None
+
 class SeamlessSpokenEnglishBot:
+    # Words accepted by listen_for_command for each action
+    NEXT_CMDS = frozenset({'next', 'continue', 'go', 'skip'})
+    REPEAT_CMDS = frozenset({'repeat', 'again', 'retry', 'redo'})
+    ENTER_CMDS = frozenset({'enter', 'okay', 'yes', 'ready'})
+    
+    # Whole main menu, written to the terminal in one call
+    MENU_TEXT = (
+        "\n📚 Practice Options:\n"
+        "  1. Beginner - Personal Topics\n"
+        "  2. Beginner - Everyday Situations\n"
+        "  3. Intermediate Conversations\n"
+        "  4. Advanced Discussions\n"
+        "  5. Free Conversation\n"
+        "  6. Pronunciation Drills\n"
+        "  7. Settings\n"
+        "  8. Exit\n"
+    )
+    
+    practice_topics = PRACTICE_TOPICS
+    
     def __init__(self, model_name="llama3.2:3b"):
         self.model_name = model_name
-        self.conversation_history = []
+        self.conversation_history = self.load_session()
+        self._history_lock = threading.Lock()
+        self._summary_thread = None
         self.session_start = datetime.now()
         self.speaking_time = 0
         self.auto_speak = True
         self.use_online_tts = False  # Will be set during voice selection
+        self.use_neural_tts = False
+        
+        # Cached set of installed Ollama models (refreshed after MODELS_CACHE_TTL)
+        self._models_cache = None
+        self._models_cache_ts = 0
+        
+        # Fixed tutor instructions; per-turn details go in separate user messages
+        self._system_prompt = """You are an encouraging English conversation tutor. Each message gives you the question the student answered, their response, and their level.
+
+Provide feedback that includes:
+1. Positive encouragement about what they did well
+2. Gentle corrections for any errors (grammar, vocabulary, pronunciation hints)
+3. Suggestions to expand their answer or improve fluency
+4. A natural follow-up question to continue the conversation
+
+Keep feedback conversational, supportive, and specific. Focus on building confidence while improving their English."""
+        
+        # (difficulty, context, normalized response) -> (simhash, embedding, feedback), oldest first
+        self._feedback_cache = OrderedDict()
+        self._last_answer = ('', '')  # (question, normalized answer) of the previous turn
+        self._embedder = None
+        if EMBEDDINGS_AVAILABLE:
+            threading.Thread(target=self.load_embedder, daemon=True).start()
+        
+        # System voice runs on its own thread, fed with text to speak
+        self._tts_queue = queue.Queue()
+        self._tts_stop = threading.Event()
+        self._tts_ready = threading.Event()  # Set once the voice thread has created its engine
+        self._rendering = False  # True while the voice thread writes rendered files
+        self._tts_error = None
+        self._voices = []
+        self._speech_cache = OrderedDict()  # Cache key -> rendered WAV bytes
+        self._tts_render_queue = queue.Queue()  # Batches of texts rendered when nothing is being said
+        
+        # Online TTS pipeline: text chunks -> fetched MP3 -> playback
+        self._tts_text_queue = queue.Queue()
+        self._tts_audio_queue = queue.Queue()
+        self._tts_workers = []
+        self._tts_channel = None
+        self._tts_finish_at = 0.0  # time.monotonic() when queued online audio ends
+        self._tts_warmup = None
+        self._http = None
+        self._last_tts = ('', {})  # Last utterance and its audio, chunk text -> MP3
+        
+        # Audio downloaded ahead of time (e.g. the next question) or recently played,
+        # chunk text -> MP3, least recently used first
+        self._tts_prefetch = OrderedDict()
+        self._tts_prefetch_lock = threading.Lock()
+        self._tts_prefetch_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        
+        # Main menu choice -> practice mode, built once instead of re-checked every loop
+        self._menu_actions = {
+            "1": lambda: self.practice_conversation("beginner", "personal"),
+            "2": lambda: self.practice_conversation("beginner", "situations"),
+            "3": lambda: self.practice_conversation("intermediate"),
+            "4": lambda: self.practice_conversation("advanced"),
+            "5": self.free_conversation,
+            "6": self.pronunciation_drill,
+            "7": self.settings_menu,
+        }
         
         # Initialize speech components if available
         if SPEECH_AVAILABLE:
             self.recognizer = sr.Recognizer()
-            self.tts_engine = pyttsx3.init()
+            # dynamic_energy_threshold is on by default, so recognition keeps tracking
+            # noise between the occasional calibrations in calibrate_microphone()
+            self._calibrated = False
+            self._last_calibration = 0
+            self._energy_threshold = self.recognizer.energy_threshold
+            # End each phrase at a short pause so it can be transcribed while the student goes on
+            self.recognizer.pause_threshold = SEGMENT_PAUSE
+            self.recognizer.non_speaking_duration = SEGMENT_PAUSE
+            self._stt_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+            self._whisper = None
+            if WHISPER_AVAILABLE:
+                threading.Thread(target=self.load_whisper, daemon=True).start()
             self.microphone = sr.Microphone()
+            self._mic_source = None  # Opened once on first listen, see microphone_source()
+            
+            # pyttsx3 isn't thread-safe, so the engine is created and used only on its own thread
+            threading.Thread(target=self.tts_engine_worker, daemon=True).start()
+            self._tts_ready.wait()
+            if self._tts_error is not None:
+                raise self._tts_error
             
             # Check for high-quality English voices
             self.setup_voice_selection()
-            
-            # Optimize speech settings
-            rate = self.tts_engine.getProperty('rate')
-            self.tts_engine.setProperty('rate', 160)  # Natural pace
-            
-            volume = self.tts_engine.getProperty('volume')
-            self.tts_engine.setProperty('volume', 0.9)
-        
-        # Practice topics for seamless conversation
-        self.practice_topics = {
-            "beginner": {
-                "personal": [
-                    "Tell me about yourself and where you're from",
-                    "What do you do for work or study?",
-                    "Describe your family to me",
-                    "What are your favorite hobbies?",
-                    "Tell me about a typical day in your life"
-                ],
-                "situations": [
-                    "You're at a restaurant ordering food. Show me how you'd order your favorite meal",
-                    "You need directions to the nearest bank. Ask me for help",
-                    "You're meeting a new coworker. Introduce yourself",
-                    "You're shopping for clothes. Ask about sizes and prices",
-                    "You want to invite a friend for coffee. Make the invitation"
-                ]
-            },
-            "intermediate": [
-                "Tell me about a memorable trip you took",
-                "Describe a challenge you faced and how you solved it",
-                "What's a skill you'd like to learn and why?",
-                "Tell me about someone who has influenced your life",
-                "Describe your ideal weekend",
-                "What's your opinion on working from home?",
-                "How has technology changed your daily life?",
-                "What's the best advice you've ever received?"
-            ],
-            "advanced": [
-                "What's your perspective on social media's impact on society?",
-                "How do you think education will change in the next 10 years?",
-                "Discuss the balance between work and personal life",
-                "What role should governments play in environmental protection?",
-                "How can we address inequality in society?",
-                "What would you do if you were the leader of your country for a day?",
-                "Discuss the advantages and disadvantages of globalization",
-                "How might artificial intelligence change our future?"
-            ]
-        }
+            if self.use_online_tts:
+                # Load requests/pygame and open the mixer while the menu is being read
+                self._tts_warmup = threading.Thread(target=self.warm_up_online_tts, daemon=True)
+                self._tts_warmup.start()
+            elif not self.use_neural_tts:
+                self.prerender_speech(STATIC_UTTERANCES)
         
     def listen_for_command(self, prompt_text):
         """Listen for voice commands like 'next', 'repeat', 'enter'"""
@@ -92,23 +366,29 @@ class SeamlessSpokenEnglishBot:
         print(f"🎤 {prompt_text}")
         print("💬 Say: 'next', 'repeat', or 'enter'")
         
+        # Don't let the microphone pick up the tutor's own voice
+        self.wait_for_speech()
+        
         try:
-            with self.microphone as source:
-                print("🎤 Listening for command... (or wait for speech to finish)")
-                self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
-                audio = self.recognizer.listen(source, timeout=20, phrase_time_limit=5)
+            source = self.microphone_source()
+            print("🎤 Listening for command... (or wait for speech to finish)")
+            self.calibrate_microphone(source, duration=0.5)
+            audio = self.recognizer.listen(source, timeout=20, phrase_time_limit=5)
             
             # Stop any ongoing speech when command is detected
             self.stop_speaking()
             
-            command = self.recognizer.recognize_google(audio, language='en-US').lower()
+            # Whisper capitalizes and punctuates ("Repeat."), so compare bare words
+            command = normalize_response(self.transcribe(audio))
             print(f"👤 Command: '{command}'")
             
-            if any(word in command for word in ['next', 'continue', 'go', 'skip']):
+            # Match whole words so e.g. 'entering' doesn't count as 'enter'
+            tokens = set(command.split())
+            if tokens & self.NEXT_CMDS:
                 return 'next'
-            elif any(word in command for word in ['repeat', 'again', 'retry', 'redo']):
+            elif tokens & self.REPEAT_CMDS:
                 return 'repeat'  
-            elif any(word in command for word in ['enter', 'okay', 'yes', 'ready']):
+            elif tokens & self.ENTER_CMDS:
                 return 'enter'
             else:
                 print(f"💡 I heard '{command}' - treating as 'enter'")
@@ -118,42 +398,85 @@ class SeamlessSpokenEnglishBot:
             print("❌ Didn't catch that. Using 'enter' as default.")
             return 'enter'
 
+    def microphone_source(self):
+        """Return the session's open microphone stream, opening it on first use"""
+        if self._mic_source is None:
+            self._mic_source = self.microphone.__enter__()
+        
+        # Drop audio buffered while nobody was listening (e.g. the tutor's voice)
+        stream = self._mic_source.stream.pyaudio_stream
+        available = stream.get_read_available()
+        if available:
+            stream.read(available, exception_on_overflow=False)
+        return self._mic_source
+
+    def close_microphone(self):
+        """Close the microphone stream opened by microphone_source()"""
+        if SPEECH_AVAILABLE and self._mic_source is not None:
+            self.microphone.__exit__(None, None, None)
+            self._mic_source = None
+
+    def calibrate_microphone(self, source, duration):
+        """Adjust for ambient noise once per session, refreshing it periodically"""
+        if (self._calibrated
+                and time.monotonic() - self._last_calibration <= AMBIENT_RECALIBRATE_SECONDS):
+            return
+        
+        if self._calibrated:
+            # Start from the last measured level so a short sample is enough
+            self.recognizer.energy_threshold = self._energy_threshold
+            duration = 0.2
+        
+        self.recognizer.adjust_for_ambient_noise(source, duration=duration)
+        self._energy_threshold = self.recognizer.energy_threshold
+        self._calibrated = True
+        self._last_calibration = time.monotonic()
+
     def check_ollama_connection(self):
         """Check Ollama connection"""
+        if (self._models_cache is not None
+                and time.monotonic() - self._models_cache_ts < MODELS_CACHE_TTL):
+            return self.model_name in self._models_cache
+        
         try:
             models_response = ollama.list()
-            available_models = []
-            
-            if hasattr(models_response, 'models'):
-                for model in models_response.models:
-                    if hasattr(model, 'model'):
-                        available_models.append(model.model)
+            self._models_cache = frozenset(
+                model.model for model in getattr(models_response, 'models', [])
+                if hasattr(model, 'model')
+            )
+            self._models_cache_ts = time.monotonic()
             
-            return self.model_name in available_models
+            return self.model_name in self._models_cache
         except Exception as e:
             print(f"❌ Ollama connection failed: {str(e)}")
             return False
 
+    def warm_up_model(self):
+        """Load the model in the background so the first feedback isn't a cold start"""
+        def warm_up():
+            try:
+                # Prefilling the tutor prompt and any restored history also caches them in Ollama
+                ollama.chat(
+                    model=self.model_name,
+                    messages=[{"role": "system", "content": self._system_prompt},
+                              *self.conversation_history],
+                    options={"num_ctx": OLLAMA_NUM_CTX, "num_predict": 1},
+                    keep_alive=OLLAMA_KEEP_ALIVE
+                )
+            except Exception:
+                pass  # The first real request will load the model instead
+        
+        threading.Thread(target=warm_up, daemon=True).start()
+
     def setup_voice_selection(self):
         """Setup native English voice selection"""
-        voices = self.tts_engine.getProperty('voices')
-        
-        # Filter for native English voices
-        english_voices = []
-        
-        # Look for high-quality English voices
-        native_keywords = [
-            'english', 'en-us', 'en-gb', 'en-au',  # Language codes
-            'american', 'british', 'australian',   # Accents
-            'hazel', 'karen', 'daniel', 'samantha', # macOS voices
-            'david', 'zira', 'mark', 'susan',      # Windows voices
-            'native', 'natural', 'premium'         # Quality indicators
-        ]
+        voices = self._voices
         
-        for voice in voices:
-            voice_info = f"{voice.name} {voice.id}".lower()
-            if any(keyword in voice_info for keyword in native_keywords):
-                english_voices.append(voice)
+        # Lowercased name/id of each voice, built once for all keyword checks
+        voice_info = {voice.id: f"{voice.name} {voice.id}".lower() for voice in voices}
+        
+        # Filter for high-quality native English voices
+        english_voices = [v for v in voices if NATIVE_VOICE_RE.search(voice_info[v.id])]
         
         if not english_voices:
             english_voices = voices[:5]  # Fallback to first 5 voices
@@ -163,12 +486,15 @@ class SeamlessSpokenEnglishBot:
         print("🌍 Choose a native English accent:")
         
         # Categorize voices by accent if possible
-        us_voices = [v for v in english_voices if any(kw in f"{v.name} {v.id}".lower() 
-                     for kw in ['us', 'american', 'zira', 'david', 'hazel'])]
-        uk_voices = [v for v in english_voices if any(kw in f"{v.name} {v.id}".lower() 
-                     for kw in ['gb', 'british', 'uk', 'daniel', 'kate'])]
-        au_voices = [v for v in english_voices if any(kw in f"{v.name} {v.id}".lower() 
-                     for kw in ['au', 'australian', 'karen', 'lee'])]
+        us_voices, uk_voices, au_voices = [], [], []
+        for voice in english_voices:
+            info = voice_info[voice.id]
+            if US_RE.search(info):
+                us_voices.append(voice)
+            if UK_RE.search(info):
+                uk_voices.append(voice)
+            if AU_RE.search(info):
+                au_voices.append(voice)
         
         voice_options = []
         option_num = 1
@@ -195,7 +521,9 @@ class SeamlessSpokenEnglishBot:
                 option_num += 1
         
         # Add other good English voices
-        other_voices = [v for v in english_voices if v not in us_voices + uk_voices + au_voices]
+        # id() because pyttsx3 Voice objects aren't hashable on every backend
+        seen = set(map(id, us_voices + uk_voices + au_voices))
+        other_voices = [v for v in english_voices if id(v) not in seen]
         if other_voices:
             print(f"\n🌐 Other English Voices:")
             for voice in other_voices[:2]:
@@ -203,6 +531,14 @@ class SeamlessSpokenEnglishBot:
                 voice_options.append(voice)
                 option_num += 1
         
+        # Local neural voice server option
+        neural_option = None
+        if NEURAL_TTS_URL:
+            print(f"\n🧠 Local Neural Voice:")
+            print(f"   {option_num}. Use neural voice server at {NEURAL_TTS_URL}")
+            neural_option = option_num
+            option_num += 1
+        
         # Online TTS option
         print(f"\n🌐 Online High-Quality Option:")
         print(f"   {option_num}. Use Google Text-to-Speech (requires internet)")
@@ -216,9 +552,15 @@ class SeamlessSpokenEnglishBot:
                 self.use_online_tts = True
                 print("✅ Will use Google Text-to-Speech (online)")
                 break
+            elif neural_option and choice == str(neural_option):
+                self.use_neural_tts = True
+                print("✅ Will use the local neural voice server")
+                print("🧪 Testing voice...")
+                self.speak_text("Hello! This is how I'll sound during our English practice.")
+                break
             elif choice.isdigit() and 1 <= int(choice) <= len(voice_options):
                 selected_voice = voice_options[int(choice) - 1]
-                self.tts_engine.setProperty('voice', selected_voice.id)
+                self._tts_queue.put(('voice', selected_voice.id))
                 print(f"✅ Selected: {selected_voice.name}")
                 self.use_online_tts = False
                 # Test the voice
@@ -229,7 +571,7 @@ class SeamlessSpokenEnglishBot:
                 # Auto-select best available voice
                 if voice_options:
                     selected_voice = voice_options[0]
-                    self.tts_engine.setProperty('voice', selected_voice.id)
+                    self._tts_queue.put(('voice', selected_voice.id))
                     print(f"✅ Auto-selected: {selected_voice.name}")
                     self.use_online_tts = False
                     print("🧪 Testing voice...")
@@ -239,89 +581,472 @@ class SeamlessSpokenEnglishBot:
                 print("❌ Please choose a valid option")
 
     def speak_text(self, text):
-        """Speak text using selected voice method"""
+        """Speak text using selected voice method
+        
+        Speech plays in the background; call wait_for_speech() to block
+        until it has finished. The listen methods do this automatically.
+        """
         if not SPEECH_AVAILABLE or not self.auto_speak:
             return
             
-        if hasattr(self, 'use_online_tts') and self.use_online_tts:
+        if self.use_neural_tts:
+            print("🔊 Speaking with neural voice...")
+            self._tts_queue.put(('stream', text))
+        elif hasattr(self, 'use_online_tts') and self.use_online_tts:
             self.speak_with_google_tts(text)
         else:
             print("🔊 Speaking...")
+            self._tts_queue.put(('say', text))
+
+    def queue_speech(self, text):
+        """Start speaking text without waiting for earlier speech to finish"""
+        if not SPEECH_AVAILABLE or not self.auto_speak:
+            return
+        
+        if self.use_neural_tts:
+            self._tts_queue.put(('stream', text))
+        elif hasattr(self, 'use_online_tts') and self.use_online_tts:
+            self.queue_google_tts(text)
+        else:
+            self._tts_queue.put(('say', text))
+
+    def wait_for_speech(self):
+        """Block until all queued speech has been played"""
+        self._tts_text_queue.join()
+        self._tts_audio_queue.join()
+        self.wait_for_tts_channel()
+        self._tts_queue.join()
+
+    def tts_engine_worker(self):
+        """Create the pyttsx3 engine and speak queued text so speaking never blocks the caller"""
+        try:
+            if sys.platform == "win32":
+                import comtypes
+                comtypes.CoInitialize()  # SAPI5 sends its events to the thread that made the engine
+            self.tts_engine = pyttsx3.init()
+            
+            # Optimize speech settings
+            self.tts_engine.setProperty('rate', 160)  # Natural pace
+            self.tts_engine.setProperty('volume', 0.9)
+            self.tts_engine.connect('started-word', self.on_tts_word)
+            self._voices = self.tts_engine.getProperty('voices')
+        except Exception as e:
+            self._tts_error = e
+            return
+        finally:
+            self._tts_ready.set()
+        
+        while True:
+            # Rendering ahead only uses the voice while nothing is waiting to be said
+            if self._tts_queue.empty() and not self._tts_render_queue.empty():
+                try:
+                    self.render_speech(self._tts_render_queue.get_nowait())
+                except Exception as e:
+                    print(f"❌ Speech error: {str(e)}")
+                continue
+            
+            action, text = self._tts_queue.get()
+            self._tts_stop.clear()
+            try:
+                if action == 'voice':
+                    self.tts_engine.setProperty('voice', text)
+                elif action == 'stream':
+                    self.stream_neural_speech(text)
+                elif action == 'say':
+                    self.say_text(text)
+            except Exception as e:
+                print(f"❌ Speech error: {str(e)}")
+            finally:
+                self._tts_queue.task_done()
+
+    def say_text(self, text):
+        """Speak text with the system voice, from its rendered audio when that plays"""
+        audio = self.cached_speech(text)
+        if audio is not None:
+            try:
+                self.play_wav(audio)
+                return
+            except Exception:
+                self.forget_speech(text)  # Don't retry a broken file on every future run
+        
+        self.tts_engine.say(text)
+        self.tts_engine.runAndWait()
+
+    def on_tts_word(self, name, location, length):
+        """Cut the current utterance short once stop_speaking() has been called"""
+        # Rendering is silent, and a cut-short file would be cached and replayed truncated
+        if self._tts_stop.is_set() and not self._rendering:
+            self.tts_engine.stop()
+
+    def stream_neural_speech(self, text):
+        """Play audio from the neural TTS server as it is synthesized"""
+        try:
+            import sounddevice as sd
+            if self._http is None:
+                self._http = self.create_tts_session()
+            
+            request = {"text": text}
+            if NEURAL_TTS_VOICE:
+                request["voice"] = NEURAL_TTS_VOICE
+            
+            with self._http.post(NEURAL_TTS_URL, json=request, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                chunks = response.iter_content(4096)
+                
+                # Read until the WAV header is complete; it gives the audio format
+                data = b""
+                header = None
+                for chunk in chunks:
+                    data += chunk
+                    header = parse_wav_header(data)
+                    if header is not None:
+                        break
+                if header is None:
+                    raise ValueError("the neural voice server returned no audio")
+                rate, channels, header_length = header
+                
+                frame = 2 * channels
+                with sd.RawOutputStream(samplerate=rate, channels=channels, dtype='int16') as out:
+                    leftover = data[header_length:]
+                    for chunk in chunks:
+                        if self._tts_stop.is_set():
+                            break
+                        # Only whole frames can be written
+                        data = leftover + chunk
+                        whole = len(data) - len(data) % frame
+                        out.write(data[:whole])
+                        leftover = data[whole:]
+                    if not self._tts_stop.is_set():
+                        out.write(leftover[:len(leftover) - len(leftover) % frame])
+        except Exception as e:
+            print(f"❌ Neural voice error: {str(e)}")
+            print("🔄 Using system voice instead")
             self.tts_engine.say(text)
             self.tts_engine.runAndWait()
 
+    def prepare_speech(self, texts):
+        """Get audio for texts ready in the background with whichever voice is in use"""
+        if not SPEECH_AVAILABLE or not self.auto_speak or self.use_neural_tts:
+            return  # The neural server streams fast enough to need no preparation
+        
+        if self.use_online_tts:
+            for text in texts:
+                self.prefetch_speech(text)
+        else:
+            self.prerender_speech(texts)
+
+    def prerender_speech(self, texts):
+        """Render system-voice audio for texts in the background so later playback is instant"""
+        texts = tuple(texts)
+        for start in range(0, len(texts), RENDER_BATCH_SIZE):
+            self._tts_render_queue.put(texts[start:start + RENDER_BATCH_SIZE])
+        # Wake the voice thread; it renders once the speech queue is empty
+        self._tts_queue.put(('render', None))
+
+    def speech_cache_key(self, text):
+        """Cache key for text spoken with the current system voice and rate"""
+        voice = self.tts_engine.getProperty('voice')
+        rate = self.tts_engine.getProperty('rate')
+        return hashlib.sha1(f"{text}|{voice}|{rate}".encode()).hexdigest()
+
+    def cached_speech(self, text):
+        """Return previously rendered WAV bytes for text, or None"""
+        if self._tts_channel is None:
+            return None  # No pygame to play cached audio with
+        
+        key = self.speech_cache_key(text)
+        if key in self._speech_cache:
+            self._speech_cache.move_to_end(key)
+            return self._speech_cache[key]
+        
+        path = SPEECH_CACHE_DIR / f"{key}.wav"
+        try:
+            audio = path.read_bytes()
+        except OSError:
+            return None
+        # WAV from SAPI5/espeak, AIFF from the macOS voice; pygame plays both
+        if len(audio) <= 44 or audio[:4] not in (b"RIFF", b"FORM"):
+            # Empty or partly written render; speak the line live instead
+            try:
+                path.unlink(missing_ok=True)
+            except OSError:
+                pass
+            return None
+        self.remember_speech(key, audio)
+        return audio
+
+    def remember_speech(self, key, audio):
+        """Keep rendered audio in memory, evicting the least recently used entry"""
+        self._speech_cache[key] = audio
+        if len(self._speech_cache) > SPEECH_CACHE_SIZE:
+            self._speech_cache.popitem(last=False)
+
+    def forget_speech(self, text):
+        """Drop rendered audio for text that failed to play, so it is spoken live instead"""
+        key = self.speech_cache_key(text)
+        self._speech_cache.pop(key, None)
+        try:
+            (SPEECH_CACHE_DIR / f"{key}.wav").unlink(missing_ok=True)
+        except OSError:
+            pass
+
+    def render_speech(self, texts):
+        """Render texts to WAV files in the speech cache with one pass of the system voice"""
+        if self._tts_channel is None:
+            self.init_audio_output()
+        if self._tts_channel is None:
+            return
+        
+        pending = {}
+        for text in texts:
+            if self.cached_speech(text) is None:
+                key = self.speech_cache_key(text)
+                pending[key] = (text, SPEECH_CACHE_DIR / f"{key}.wav")
+        if not pending:
+            return
+        
+        try:
+            SPEECH_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            return  # Speak live instead if the cache can't be written
+        
+        # pyttsx3 works through every queued file in a single loop run
+        self._rendering = True
+        try:
+            for text, path in pending.values():
+                self.tts_engine.save_to_file(text, str(path))
+            self.tts_engine.runAndWait()
+        except Exception:
+            # Don't leave files from a failed pass to be played on later runs
+            for _, path in pending.values():
+                try:
+                    path.unlink(missing_ok=True)
+                except OSError:
+                    pass
+            raise
+        finally:
+            self._rendering = False
+        
+        # Loads each new file into memory, discarding any that came out empty
+        for text, _ in pending.values():
+            self.cached_speech(text)
+
+    def play_wav(self, audio):
+        """Play rendered WAV bytes on the TTS channel until done or stopped"""
+        import io
+        import pygame
+        
+        sound = pygame.mixer.Sound(io.BytesIO(audio))
+        self._tts_channel.play(sound)
+        if self._tts_stop.wait(sound.get_length()):
+            self._tts_channel.stop()
+
+    def wait_for_tts_channel(self):
+        """Block until the online TTS channel has nothing playing"""
+        if self._tts_channel is None:
+            return
+        import pygame
+        
+        # Sleep until the known end of the queued audio, then absorb small drift
+        remaining = self._tts_finish_at - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+        while self._tts_channel.get_busy():
+            pygame.time.wait(5)
+
     def stop_speaking(self):
         """Stop any ongoing speech"""
+        for pending in (self._tts_text_queue, self._tts_audio_queue, self._tts_queue):
+            while True:
+                try:
+                    pending.get_nowait()
+                except queue.Empty:
+                    break
+                pending.task_done()
+        
         if hasattr(self, 'use_online_tts') and self.use_online_tts:
             try:
-                import pygame
-                if pygame.mixer.get_init():
-                    pygame.mixer.music.stop()
+                if self._tts_channel is not None:
+                    self._tts_channel.stop()
+                    self._tts_finish_at = 0.0
             except:
                 pass
-        else:
-            self.tts_engine.stop()
+        
+        self._tts_stop.set()
 
     def speak_with_google_tts(self, text):
         """Use Google TTS for higher quality voice"""
+        # Google TTS API (free, no key required)
+        print("🔊 Speaking with Google TTS...")
+        self.queue_google_tts(text)
+
+    def queue_google_tts(self, text):
+        """Queue text for the background Google TTS fetch and playback threads"""
+        if self._tts_warmup is not None:
+            self._tts_warmup.join()
+        
         try:
             import requests
-            import io
             import pygame
-            import threading
-            
-            # Google TTS API (free, no key required)
-            print("🔊 Speaking with Google TTS...")
-            
-            # Split long text into chunks to avoid TTS limits
-            chunks = self.split_text_for_tts(text)
-            
-            for chunk in chunks:
-                # Prepare the request
-                url = "https://translate.google.com/translate_tts"
-                params = {
-                    'ie': 'UTF-8',
-                    'q': chunk,
-                    'tl': 'en-us',  # US English
-                    'client': 'tw-ob',
-                    'ttsspeed': '0.7'  # Slower for learning
-                }
-                
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                }
-                
-                response = requests.get(url, params=params, headers=headers, timeout=10)
-                
-                if response.status_code == 200:
-                    # Initialize pygame mixer for audio playback
-                    if not pygame.mixer.get_init():
-                        pygame.mixer.init()
-                    
-                    # Load and play the audio
-                    audio_data = io.BytesIO(response.content)
-                    pygame.mixer.music.load(audio_data)
-                    pygame.mixer.music.play()
-                    
-                    # Wait for playback to finish
-                    while pygame.mixer.music.get_busy():
-                        pygame.time.wait(100)
-                        
-                else:
-                    print("❌ Online TTS failed, using system voice")
-                    self.tts_engine.say(chunk)
-                    self.tts_engine.runAndWait()
-                    
         except ImportError:
             print("❌ Online TTS requires: pip install requests pygame")
             print("🔄 Using system voice instead")
-            self.tts_engine.say(text)
-            self.tts_engine.runAndWait()
-        except Exception as e:
-            print(f"❌ Online TTS error: {str(e)}")
-            print("🔄 Using system voice instead")
-            self.tts_engine.say(text)
-            self.tts_engine.runAndWait()
+            self._tts_queue.put(('say', text))
+            return
+        
+        if not self._tts_workers:
+            self._tts_workers = [
+                threading.Thread(target=self.tts_fetch_worker, daemon=True),
+                threading.Thread(target=self.tts_playback_worker, daemon=True)
+            ]
+            for worker in self._tts_workers:
+                worker.start()
+        
+        # Split long text into chunks to avoid TTS limits
+        for chunk in self.split_text_for_tts(text):
+            self._tts_text_queue.put((text, chunk))
+
+    def tts_fetch_worker(self):
+        """Download MP3 audio for queued chunks while earlier chunks play"""
+        while True:
+            text, chunk = self._tts_text_queue.get()
+            
+            # Replaying the last utterance (e.g. 'repeat') reuses its audio
+            last_text, last_audio = self._last_tts
+            audio = last_audio.get(chunk) if text == last_text else None
+            if audio is None:
+                # Kept after playing, so a question repeated after its feedback is still cached
+                with self._tts_prefetch_lock:
+                    audio = self._tts_prefetch.get(chunk)
+                    if audio is not None:
+                        self._tts_prefetch.move_to_end(chunk)
+            try:
+                if audio is None:
+                    audio = self.fetch_google_tts(chunk)
+                    if audio is not None:
+                        self.store_tts_bytes(chunk, audio)
+            except Exception as e:
+                print(f"❌ Online TTS error: {str(e)}")
+                audio = None
+            
+            if audio is not None:
+                if text != last_text:
+                    self._last_tts = (text, {})
+                self._last_tts[1][chunk] = audio
+            self._tts_audio_queue.put((chunk, audio))
+            self._tts_text_queue.task_done()
+
+    def tts_playback_worker(self):
+        """Play fetched MP3 chunks in the order they were queued"""
+        while True:
+            chunk, audio = self._tts_audio_queue.get()
+            try:
+                if audio is None:
+                    print("❌ Online TTS failed, using system voice")
+                    self.wait_for_tts_channel()
+                    self._tts_queue.put(('say', chunk))
+                    self._tts_queue.join()
+                else:
+                    self.play_mp3(audio)
+            except Exception as e:
+                print(f"❌ Online TTS error: {str(e)}")
+            finally:
+                self._tts_audio_queue.task_done()
+
+    def warm_up_online_tts(self):
+        """Do the one-time online TTS setup off the main thread"""
+        self._http = self.create_tts_session()
+        self.init_audio_output()
+
+    def create_tts_session(self):
+        """Create a keep-alive HTTP session so TTS requests share connections"""
+        try:
+            import requests
+            from requests.adapters import HTTPAdapter
+        except ImportError:
+            return None
+        
+        session = requests.Session()
+        session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+        session.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=2))
+        session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        })
+        return session
+
+    def fetch_google_tts(self, chunk):
+        """Fetch MP3 audio for one chunk, or None if Google TTS refused it"""
+        # Prepare the request
+        url = "https://translate.google.com/translate_tts"
+        params = {
+            'ie': 'UTF-8',
+            'q': chunk,
+            'tl': 'en-us',  # US English
+            'client': 'tw-ob',
+            'ttsspeed': '0.7'  # Slower for learning
+        }
+        
+        response = self._http.get(url, params=params, timeout=10)
+        
+        if response.status_code == 200:
+            return response.content
+        return None
+
+    def prefetch_speech(self, text):
+        """Download online TTS audio for text in the background before it is spoken"""
+        if (SPEECH_AVAILABLE and self.auto_speak and self.use_online_tts
+                and self._http is not None):
+            self._tts_prefetch_pool.submit(self.fetch_tts_bytes, text)
+
+    def fetch_tts_bytes(self, text):
+        """Fetch and store MP3 audio for each TTS chunk of text"""
+        for chunk in self.split_text_for_tts(text):
+            with self._tts_prefetch_lock:
+                if chunk in self._tts_prefetch:
+                    continue
+            try:
+                audio = self.fetch_google_tts(chunk)
+            except Exception:
+                audio = None  # The playback pipeline will retry on its own
+            if audio is not None:
+                self.store_tts_bytes(chunk, audio)
+
+    def store_tts_bytes(self, chunk, audio):
+        """Keep MP3 audio for a chunk, evicting the least recently used one when full"""
+        with self._tts_prefetch_lock:
+            self._tts_prefetch[chunk] = audio
+            self._tts_prefetch.move_to_end(chunk)
+            if len(self._tts_prefetch) > TTS_PREFETCH_SIZE:
+                self._tts_prefetch.popitem(last=False)
+
+    def init_audio_output(self):
+        """Open the pygame mixer once and reserve a channel for TTS playback"""
+        try:
+            import pygame
+        except ImportError:
+            return
+        
+        # Google TTS returns 24 kHz audio; a small buffer keeps the start snappy
+        if not pygame.mixer.get_init():
+            pygame.mixer.init(frequency=24000, buffer=512)
+        pygame.mixer.set_reserved(1)
+        self._tts_channel = pygame.mixer.Channel(0)
+
+    def play_mp3(self, audio):
+        """Queue MP3 bytes to play right after the chunk that is currently playing"""
+        import io
+        import pygame
+        
+        if self._tts_channel is None:
+            self.init_audio_output()
+        
+        sound = pygame.mixer.Sound(io.BytesIO(audio))
+        
+        # A channel holds a single queued sound, so wait for that slot to free up
+        while self._tts_channel.get_queue() is not None:
+            pygame.time.wait(20)
+        self._tts_channel.queue(sound)
+        self._tts_finish_at = max(self._tts_finish_at, time.monotonic()) + sound.get_length()
 
     def split_text_for_tts(self, text, max_length=200):
         """Split long text into chunks for TTS"""
@@ -329,19 +1054,24 @@ class SeamlessSpokenEnglishBot:
             return [text]
         
         chunks = []
-        sentences = text.split('. ')
-        current_chunk = ""
+        # Sentences keep their own '.', '!' or '?' so they are rejoined with spaces
+        sentences = SENTENCE_BREAK.split(text.strip())
+        current = []
+        current_len = 0
         
         for sentence in sentences:
-            if len(current_chunk + sentence) <= max_length:
-                current_chunk += sentence + ". "
+            sentence_len = len(sentence) + 1
+            if current_len + sentence_len <= max_length:
+                current.append(sentence)
+                current_len += sentence_len
             else:
-                if current_chunk:
-                    chunks.append(current_chunk.strip())
-                current_chunk = sentence + ". "
+                if current:
+                    chunks.append(' '.join(current))
+                current = [sentence]
+                current_len = sentence_len
         
-        if current_chunk:
-            chunks.append(current_chunk.strip())
+        if current:
+            chunks.append(' '.join(current))
         
         return chunks
 
@@ -350,28 +1080,22 @@ class SeamlessSpokenEnglishBot:
         if not SPEECH_AVAILABLE:
             return input("👤 Your response: ")
         
+        # Don't let the microphone pick up the tutor's own voice
+        self.wait_for_speech()
+        
         max_retries = 2
         retry_count = 0
         
         while retry_count < max_retries:
             try:
-                with self.microphone as source:
-                    print("🎤 Listening... (speak clearly and take your time)")
-                    # Longer adjustment for better recognition
-                    self.recognizer.adjust_for_ambient_noise(source, duration=1.0)
-                    # Longer phrase time limit for complete thoughts
-                    audio = self.recognizer.listen(source, timeout=timeout, phrase_time_limit=120)
-                
-                print("🔄 Processing your speech...")
-                text = self.recognizer.recognize_google(audio, language='en-US')
+                text = self.record_answer(timeout)
                 
                 if len(text.split()) < 2:  # Very short responses
                     print(f"👤 I heard: '{text}' - but that seems quite short.")
                     continue_choice = input("Would you like to say more or continue? [say more/continue]: ").strip().lower()
                     if continue_choice.startswith('s'):  # "say more"
                         print("🎤 Please continue speaking...")
-                        more_audio = self.recognizer.listen(source, timeout=60, phrase_time_limit=120)
-                        more_text = self.recognizer.recognize_google(more_audio, language='en-US')
+                        more_text = self.record_answer(timeout=60)
                         text = text + " " + more_text
                 
                 return text
@@ -400,38 +1124,284 @@ class SeamlessSpokenEnglishBot:
         
         return input("👤 Please type your response: ")
 
-    def get_ai_feedback(self, user_response, question, difficulty):
-        """Get comprehensive AI feedback"""
-        system_prompt = f"""You are an encouraging English conversation tutor. The student just answered: "{question}"
-
-Their response was: "{user_response}"
-
-Level: {difficulty}
+    def record_answer(self, timeout):
+        """Record an answer in short segments, transcribing each while the student keeps talking"""
+        transcripts = []
+        segments = []
+        spoken = 0.0
+        
+        source = self.microphone_source()
+        print("🎤 Listening... (speak clearly and take your time)")
+        # Longer adjustment for better recognition
+        self.calibrate_microphone(source, duration=1.0)
+        
+        wait = timeout
+        # Longer time limit for complete thoughts
+        while spoken < ANSWER_TIME_LIMIT:
+            try:
+                audio = self.recognizer.listen(source, timeout=wait,
+                                               phrase_time_limit=ANSWER_TIME_LIMIT - spoken)
+            except sr.WaitTimeoutError:
+                if transcripts:
+                    break  # The student paused long enough to finish
+                raise
+            
+            spoken += len(audio.frame_data) / (audio.sample_rate * audio.sample_width)
+            segments.append(audio)
+            transcripts.append(self._stt_pool.submit(self.transcribe, audio))
+            wait = ANSWER_PAUSE
+        
+        print("🔄 Processing your speech...")
+        parts = []
+        dropped = False
+        for transcript in transcripts:
+            try:
+                parts.append(transcript.result())
+            except sr.UnknownValueError:
+                dropped = True
+        
+        if dropped and len(segments) > 1:
+            # A segment failed on its own; recognize the whole answer with its full context
+            whole = sr.AudioData(b"".join(segment.frame_data for segment in segments),
+                                 segments[0].sample_rate, segments[0].sample_width)
+            try:
+                return self.transcribe(whole)
+            except (sr.UnknownValueError, sr.RequestError):
+                if parts:
+                    print("⚠️ Part of your answer couldn't be understood and was left out")
+        
+        if not parts:
+            raise sr.UnknownValueError()
+        return " ".join(parts)
 
-Provide feedback that includes:
-1. Positive encouragement about what they did well
-2. Gentle corrections for any errors (grammar, vocabulary, pronunciation hints)
-3. Suggestions to expand their answer or improve fluency
-4. A natural follow-up question to continue the conversation
+    def load_whisper(self):
+        """Load the local Whisper model without holding up startup"""
+        try:
+            import ctranslate2
+            import numpy as np
+            from faster_whisper import WhisperModel
+        except Exception as e:
+            print(f"❌ Local speech recognition unavailable: {str(e)}")
+            return
+        
+        # Half precision on a CUDA GPU, 8-bit weights on the CPU
+        options = [("cpu", "int8")]
+        if ctranslate2.get_cuda_device_count() > 0:
+            options.insert(0, ("cuda", "float16"))
+        
+        for device, compute_type in options:
+            try:
+                model = WhisperModel(WHISPER_MODEL, device=device, compute_type=compute_type)
+                # A GPU can be detected without its CUDA libraries, which only fails on first use
+                list(model.transcribe(np.zeros(16000, np.float32), beam_size=1)[0])
+            except Exception as e:
+                print(f"❌ Local speech recognition failed on {device}: {str(e)}")
+                continue
+            self._whisper = model
+            return
 
-Keep feedback conversational, supportive, and specific. Focus on building confidence while improving their English."""
+    def transcribe(self, audio):
+        """Turn recorded audio into text, locally with Whisper once it has loaded"""
+        if self._whisper is None:
+            return self.recognizer.recognize_google(audio, language='en-US')
+        
+        import numpy as np
+        pcm = audio.get_raw_data(convert_rate=16000, convert_width=2)
+        samples = np.frombuffer(pcm, np.int16).astype(np.float32) / 32768
+        try:
+            # Noise-only pieces make Whisper invent text ("Thank you."), so VAD trims them first
+            segments, _ = self._whisper.transcribe(samples, language="en", beam_size=1, vad_filter=True)
+            text = " ".join(segment.text.strip() for segment in segments
+                            if segment.no_speech_prob < WHISPER_MAX_NO_SPEECH_PROB).strip()
+        except Exception as e:
+            print(f"❌ Local speech recognition error: {str(e)}")
+            print("🔄 Using Google speech recognition instead")
+            self._whisper = None
+            return self.recognizer.recognize_google(audio, language='en-US')
+        
+        if not text:
+            raise sr.UnknownValueError()
+        return text
 
+    def get_ai_feedback(self, user_response, question, difficulty, live=False):
+        """Get comprehensive AI feedback
+        
+        With live=True the feedback is printed as it streams in and each
+        finished sentence is read aloud while the rest is still generating.
+        """
+        # Only the latest turn changes, so Ollama can reuse the cached prompt prefix
+        turn = {"role": "user", "content": f"Question: {question}\nMy response: {user_response}\nLevel: {difficulty}"}
+        
+        normalized = normalize_response(user_response)
+        last_question, last_answer = self._last_answer
+        self._last_answer = (question, normalized)
+        
+        # Open-ended turns follow on from what the student said before, so that is part of the context
+        context = question
+        if question == FREE_CONVERSATION_TOPIC:
+            context = (question, last_answer)
+        
+        # A second try at the same question is usually a correction ("I goes" -> "I go"),
+        # which only an exact match may answer from the cache
+        fuzzy = question != last_question or question == FREE_CONVERSATION_TOPIC
+        
+        # Repeated drill answers reuse earlier feedback instead of a new generation
+        feedback = self.lookup_cached_feedback(difficulty, context, normalized, fuzzy)
+        if feedback is not None:
+            self.deliver_feedback(feedback, live)
+            self.remember_turn(turn, feedback)
+            return feedback
+        
         try:
-            response = ollama.chat(
+            stream = ollama.chat(
                 model=self.model_name,
                 messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": f"My response was: '{user_response}'"}
-                ]
+                    {"role": "system", "content": self._system_prompt},
+                    *self.conversation_history,
+                    turn
+                ],
+                options={"num_ctx": OLLAMA_NUM_CTX, "num_keep": -1},
+                keep_alive=OLLAMA_KEEP_ALIVE,
+                stream=True
             )
             
-            if response and 'message' in response:
-                return response['message']['content']
+            parts = []
+            pending = ""
+            for part in stream:
+                content = part['message']['content']
+                parts.append(content)
+                if live:
+                    print(content, end="", flush=True)
+                    pending += content
+                    *sentences, pending = SENTENCE_BREAK.split(pending)
+                    for sentence in sentences:
+                        if sentence.strip():
+                            self.queue_speech(sentence)
+            
+            feedback = "".join(parts)
+            if live:
+                print()
+                if pending.strip():
+                    self.queue_speech(pending)
+            
+            if feedback:
+                self.cache_feedback(difficulty, context, normalized, feedback)
+                self.remember_turn(turn, feedback)
+                return feedback
             else:
-                return "Great job speaking English! Keep practicing."
+                return self.deliver_feedback("Great job speaking English! Keep practicing.", live)
                 
         except Exception as e:
-            return f"Good effort! Let's continue practicing. (Error: {str(e)})"
+            return self.deliver_feedback(f"Good effort! Let's continue practicing. (Error: {str(e)})", live)
+
+    def deliver_feedback(self, feedback, live):
+        """Print and speak feedback that was not streamed, when live output is on"""
+        if live:
+            print(feedback)
+            self.speak_text(feedback)
+        return feedback
+
+    def load_embedder(self):
+        """Load the sentence embedding model without holding up startup"""
+        try:
+            from sentence_transformers import SentenceTransformer
+            self._embedder = SentenceTransformer(EMBEDDING_MODEL)
+        except Exception:
+            pass  # SimHash matching still catches near-identical answers
+
+    def embed(self, text):
+        """Unit-length embedding of text, or None until the model has loaded"""
+        if self._embedder is None:
+            return None
+        return self._embedder.encode(text, normalize_embeddings=True)
+
+    def remember_turn(self, turn, feedback):
+        """Record a feedback exchange in the conversation history"""
+        with self._history_lock:
+            self.conversation_history.append(turn)
+            self.conversation_history.append({"role": "assistant", "content": feedback})
+            too_long = len(self.conversation_history) > 2 * MAX_HISTORY_TURNS
+        
+        # Summarize in the background so the student never waits on it
+        if too_long and (self._summary_thread is None or not self._summary_thread.is_alive()):
+            self._summary_thread = threading.Thread(target=self.summarize_history, daemon=True)
+            self._summary_thread.start()
+
+    def load_session(self):
+        """Restore the conversation history saved by the last run"""
+        try:
+            history = json.loads(SESSION_FILE.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return []
+        if not isinstance(history, list):
+            return []
+        # Only keep well-formed chat messages from the file
+        return [message for message in history
+                if isinstance(message, dict) and set(message) == {"role", "content"}]
+
+    def save_session(self):
+        """Save the conversation history so the next run can continue it"""
+        try:
+            SESSION_FILE.parent.mkdir(parents=True, exist_ok=True)
+            SESSION_FILE.write_text(json.dumps(self.conversation_history), encoding="utf-8")
+        except OSError:
+            pass  # The next run just starts a fresh conversation
+
+    def summarize_history(self):
+        """Fold older turns into a short summary so each request stays a bounded size"""
+        keep = 2 * HISTORY_TURNS_KEPT
+        older = self.conversation_history[:-keep]
+        transcript = "\n".join(f"{message['role']}: {message['content']}" for message in older)
+        
+        try:
+            response = ollama.chat(
+                model=self.model_name,
+                messages=[{"role": "user", "content": f"Summarize in 2 sentences: {transcript}"}],
+                options={"num_ctx": OLLAMA_NUM_CTX, "num_predict": 80},
+                keep_alive=OLLAMA_KEEP_ALIVE
+            )
+            summary = response['message']['content'].strip()
+        except Exception:
+            summary = ""  # Drop the older turns rather than let the prompt keep growing
+        
+        # Turns recorded while the summary was generating are kept after it
+        with self._history_lock:
+            recent = self.conversation_history[len(older):]
+            if summary:
+                recent.insert(0, {"role": "system", "content": f"Prior summary: {summary}"})
+            self.conversation_history = recent
+
+    def lookup_cached_feedback(self, difficulty, context, normalized, fuzzy=True):
+        """Return cached feedback for the same or (with fuzzy) a near-identical answer in the same context"""
+        key = (difficulty, context, normalized)
+        if key in self._feedback_cache:
+            self._feedback_cache.move_to_end(key)
+            return self._feedback_cache[key][2]
+        
+        if not fuzzy or len(normalized.split()) > NEAR_DUPLICATE_MAX_WORDS:
+            return None
+        
+        fingerprint = simhash(normalized)
+        embedding = None
+        for (cached_difficulty, cached_context, _), (cached_hash, cached_embedding, feedback) in self._feedback_cache.items():
+            if cached_difficulty != difficulty or cached_context != context:
+                continue
+            if bin(fingerprint ^ cached_hash).count('1') <= SIMHASH_MAX_DISTANCE:
+                return feedback
+            if cached_embedding is not None:
+                if embedding is None:
+                    embedding = self.embed(normalized)
+                if embedding is not None and float(embedding @ cached_embedding) >= EMBEDDING_MIN_SIMILARITY:
+                    return feedback
+        return None
+
+    def cache_feedback(self, difficulty, context, normalized, feedback):
+        """Store feedback, evicting the least recently used entry when full"""
+        # Longer answers are only ever matched exactly, so they need no embedding
+        embedding = self.embed(normalized) if len(normalized.split()) <= NEAR_DUPLICATE_MAX_WORDS else None
+        self._feedback_cache[(difficulty, context, normalized)] = (simhash(normalized), embedding, feedback)
+        if len(self._feedback_cache) > FEEDBACK_CACHE_SIZE:
+            self._feedback_cache.popitem(last=False)
 
     def practice_conversation(self, difficulty, category=None):
         """Run seamless conversation practice"""
@@ -444,13 +1414,13 @@ Keep feedback conversational, supportive, and specific. Focus on building confid
             questions = self.practice_topics[difficulty]
             print(f"\n🗣️ Speaking Practice - {difficulty.title()} Level")
         
-        print("=" * 50)
-        print("🎤 Ready for natural conversation practice!")
-        print("⏰ Speak naturally - I'll listen and give you feedback")
-        print("💡 Say 'next question' or 'finish' to control the session\n")
+        print(BANNER,
+              "🎤 Ready for natural conversation practice!",
+              "⏰ Speak naturally - I'll listen and give you feedback",
+              "💡 Say 'next question' or 'finish' to control the session\n", sep="\n")
         
         # Initial greeting and first question setup
-        greeting = "Hi! I'm your English conversation partner. Let's practice speaking naturally. I'll ask you questions one by one, listen carefully to your answers, and give you helpful feedback."
+        greeting = PRACTICE_GREETING
         print(f"🤖 Tutor: {greeting}")
         self.speak_text(greeting)
         
@@ -465,19 +1435,24 @@ Keep feedback conversational, supportive, and specific. Focus on building confid
         
         for question in questions:
             question_count += 1
-            print(f"\n" + "="*50)
-            print(f"🎯 Question {question_count}/{len(questions)}")
-            print(f"🤖 Tutor: {question}")
+            
+            # Download the next question's audio while this one is answered
+            if question_count < len(questions):
+                self.prefetch_speech(questions[question_count])
             
             # Always speak the question aloud
-            print("🔊 Reading question aloud...")
+            print(f"\n{BANNER}",
+                  f"🎯 Question {question_count}/{len(questions)}",
+                  f"🤖 Tutor: {question}",
+                  "🔊 Reading question aloud...", sep="\n")
             self.speak_text(question)
             
-            print(f"\n💭 Take your time to think about your answer...")
-            print("🎤 When you're ready, start speaking. I'll listen for up to 2 minutes.")
-            print("💡 Try to speak for at least 30 seconds to practice fluency")
+            print(f"\n💭 Take your time to think about your answer...",
+                  "🎤 When you're ready, start speaking. I'll listen for up to 2 minutes.",
+                  "💡 Try to speak for at least 30 seconds to practice fluency", sep="\n")
             
-            # Get user response
+            # Get user response, timing it from after the question finishes playing
+            self.wait_for_speech()
             speaking_start = time.time()
             user_response = self.listen_for_speech()
             speaking_duration = time.time() - speaking_start
@@ -487,80 +1462,71 @@ Keep feedback conversational, supportive, and specific. Focus on building confid
                 continue
             
             # Check for control commands
-            if user_response.lower() in ['next question', 'next', 'skip']:
+            response_lower = normalize_response(user_response)
+            if response_lower in SKIP_CMDS:
                 print("⏭️ Moving to next question...")
                 continue
-            elif user_response.lower() in ['finish', 'stop', 'quit', 'done']:
+            elif response_lower in STOP_CMDS:
                 print("🏁 Finishing practice session...")
                 break
-            elif user_response.lower() in ['repeat question', 'repeat', 'again']:
+            elif response_lower in REPEAT_Q_CMDS:
                 print(f"🔄 Repeating: {question}")
                 self.speak_text(question)
                 continue
             
             # Display what user said clearly
-            print(f"\n" + "="*50)
-            print(f"👤 YOU SAID:")
-            print(f"   \"{user_response}\"")
-            print(f"⏱️ Speaking time: {speaking_duration:.1f} seconds")
-            print(f"📝 Word count: {len(user_response.split())} words")
-            print("="*50)
+            print(f"\n{BANNER}",
+                  f"👤 YOU SAID:",
+                  f"   \"{user_response}\"",
+                  f"⏱️ Speaking time: {speaking_duration:.1f} seconds",
+                  f"📝 Word count: {len(user_response.split())} words",
+                  BANNER, sep="\n")
             
             # Get and display feedback
-            print(f"\n🤖 Getting personalized feedback...")
-            feedback = self.get_ai_feedback(user_response, question, difficulty)
+            print(f"\n🤖 Getting personalized feedback...",
+                  f"\n💬 TUTOR FEEDBACK:", sep="\n")
             
-            print(f"\n💬 TUTOR FEEDBACK:")
-            print(f"{feedback}")
-            print("\n🔊 Reading feedback aloud with Google TTS...")
-            
-            # Always speak feedback using the same voice (Google TTS)
-            self.speak_text(feedback)
+            # Feedback is printed and read aloud sentence by sentence as it arrives
+            feedback = self.get_ai_feedback(user_response, question, difficulty, live=True)
             
             # Wait for user to be ready for next question
             if question_count < len(questions):
-                print(f"\n" + "="*50)
-                print("✅ Feedback complete!")
-                print("⏳ Processing feedback...")
+                print(f"\n{BANNER}",
+                      "✅ Feedback complete!",
+                      "⏳ Processing feedback...", sep="\n")
                 
                 # Use voice commands with better flow control
                 while True:
                     command = self.listen_for_command("What would you like to do?")
                     
                     if command == 'repeat':
-                        print("🔄 Let's try this question again!")
-                        print(f"🤖 Tutor: {question}")
-                        print("🔊 Reading question again...")
+                        print("🔄 Let's try this question again!",
+                              f"🤖 Tutor: {question}",
+                              "🔊 Reading question again...", sep="\n")
                         self.speak_text(question)
                         
                         # Let them answer the same question again
-                        print(f"\n💭 Take your time to think about your answer...")
-                        print("🎤 When ready, give it another try!")
+                        print(f"\n💭 Take your time to think about your answer...",
+                              "🎤 When ready, give it another try!", sep="\n")
                         
                         # Get new response
+                        self.wait_for_speech()
                         speaking_start = time.time()
                         new_response = self.listen_for_speech()
                         new_speaking_duration = time.time() - speaking_start
                         
-                        if new_response and not new_response.lower() in ['next question', 'next', 'skip', 'finish', 'stop', 'quit', 'done']:
-                            print(f"\n" + "="*50)
-                            print(f"👤 YOUR NEW ANSWER:")
-                            print(f"   \"{new_response}\"")
-                            print(f"⏱️ Speaking time: {new_speaking_duration:.1f} seconds")
-                            print(f"📝 Word count: {len(new_response.split())} words")
-                            print("="*50)
+                        if new_response and normalize_response(new_response) not in CONTROL_CMDS:
+                            print(f"\n{BANNER}",
+                                  f"👤 YOUR NEW ANSWER:",
+                                  f"   \"{new_response}\"",
+                                  f"⏱️ Speaking time: {new_speaking_duration:.1f} seconds",
+                                  f"📝 Word count: {len(new_response.split())} words",
+                                  BANNER, sep="\n")
                             
                             # Get new feedback
-                            print(f"\n🤖 Getting feedback on your new answer...")
-                            new_feedback = self.get_ai_feedback(new_response, question, difficulty)
-                            print(f"\n💬 NEW FEEDBACK:")
-                            print(f"{new_feedback}")
-                            print("\n🔊 Reading new feedback...")
-                            self.speak_text(new_feedback)
-                            
-                            # Update conversation history
-                            self.conversation_history.append({"role": "user", "content": new_response})
-                            self.conversation_history.append({"role": "assistant", "content": new_feedback})
+                            print(f"\n🤖 Getting feedback on your new answer...",
+                                  f"\n💬 NEW FEEDBACK:", sep="\n")
+                            new_feedback = self.get_ai_feedback(new_response, question, difficulty, live=True)
                             
                         print("\n✅ Ready for next question!")
                         input("Press Enter to continue...")
@@ -581,7 +1547,7 @@ Keep feedback conversational, supportive, and specific. Focus on building confid
         print("\n💬 Free Conversation Mode")
         print("=" * 40)
         
-        greeting = "Let's have a free conversation! Talk about anything you want - your day, your thoughts, your dreams. I'm here to listen and help you practice English naturally."
+        greeting = FREE_CONVERSATION_GREETING
         print(f"🤖 Tutor: {greeting}")
         self.speak_text(greeting)
         
@@ -594,16 +1560,15 @@ Keep feedback conversational, supportive, and specific. Focus on building confid
             
             user_response = self.listen_for_speech(timeout=60)
             
-            if not user_response or user_response.lower() in ['finish', 'stop', 'quit', 'done', 'goodbye']:
+            if not user_response or normalize_response(user_response) in END_CONVERSATION_CMDS:
                 print("👋 Thanks for the great conversation!")
                 break
             
             print(f"\n👤 You said: \"{user_response}\"")
             
             # Get conversational response
-            feedback = self.get_ai_feedback(user_response, "free conversation", "conversational")
-            print(f"\n🤖 Tutor: {feedback}")
-            self.speak_text(feedback)
+            print(f"\n🤖 Tutor: ", end="", flush=True)
+            feedback = self.get_ai_feedback(user_response, FREE_CONVERSATION_TOPIC, "conversational", live=True)
 
     def pronunciation_drill(self):
         """Quick pronunciation practice"""
@@ -617,13 +1582,19 @@ Keep feedback conversational, supportive, and specific. Focus on building confid
             {"sound": "V and W", "words": ["very", "worry", "voice", "choice", "review"]}
         ]
         
-        intro = "Let's practice some challenging English sounds. I'll say a word, then you repeat it. Ready?"
+        intro = DRILL_INTRO
         print(f"🤖 Tutor: {intro}")
         self.speak_text(intro)
         
+        # Synthesize the drill lines in the background, behind whatever is being said.
+        # The first line is spoken straight after the intro, so only the later ones are prepared
+        lines = [line for drill in drills
+                 for line in (DRILL_SOUND_INTRO.format(sound=drill['sound']), *drill['words'])]
+        self.prepare_speech(lines[1:])
+        
         for drill in drills:
             print(f"\n🎯 Practicing: {drill['sound']}")
-            sound_intro = f"Now let's practice {drill['sound']}. Listen and repeat each word."
+            sound_intro = DRILL_SOUND_INTRO.format(sound=drill['sound'])
             print(f"🤖 Tutor: {sound_intro}")
             self.speak_text(sound_intro)
             
@@ -637,7 +1608,7 @@ Keep feedback conversational, supportive, and specific. Focus on building confid
                 if user_pronunciation:
                     print(f"👤 You said: \"{user_pronunciation}\"")
                     if word.lower() in user_pronunciation.lower():
-                        feedback = "Perfect! Great pronunciation."
+                        feedback = DRILL_PERFECT
                     else:
                         feedback = f"Good try! Let's practice '{word}' again."
                     print(f"💬 {feedback}")
@@ -646,7 +1617,7 @@ Keep feedback conversational, supportive, and specific. Focus on building confid
     def show_practice_stats(self):
         """Show practice session statistics"""
         duration = datetime.now() - self.session_start
-        print(f"\n" + "="*50)
+        print(f"\n{BANNER}")
         print(f"📊 Practice Session Complete!")
         print(f"⏱️ Total session time: {str(duration).split('.')[0]}")
         if SPEECH_AVAILABLE and self.speaking_time > 0:
@@ -654,7 +1625,7 @@ Keep feedback conversational, supportive, and specific. Focus on building confid
             speaking_percentage = (self.speaking_time / duration.total_seconds()) * 100
             print(f"📈 Speaking percentage: {speaking_percentage:.1f}%")
         print(f"💪 Excellent work practicing your English speaking!")
-        print("="*50)
+        print(BANNER)
 
     def settings_menu(self):
         """Quick settings adjustment"""
@@ -670,38 +1641,23 @@ Keep feedback conversational, supportive, and specific. Focus on building confid
 
     def main_menu(self):
         """Streamlined main menu"""
-        print("🗣️ English Speaking Practice")
-        print("=" * 40)
+        print("🗣️ English Speaking Practice", "=" * 40, sep="\n")
         
         while True:
-            print("\n📚 Practice Options:")
-            print("  1. Beginner - Personal Topics")
-            print("  2. Beginner - Everyday Situations") 
-            print("  3. Intermediate Conversations")
-            print("  4. Advanced Discussions")
-            print("  5. Free Conversation")
-            print("  6. Pronunciation Drills")
-            print("  7. Settings")
-            print("  8. Exit")
+            sys.stdout.write(self.MENU_TEXT)
+            sys.stdout.flush()
+            
+            # Get the opening lines of every mode ready while the user chooses
+            self.prepare_speech(MODE_OPENING_LINES)
             
             choice = input("\nChoose (1-8): ").strip()
             
-            if choice == "1":
-                self.practice_conversation("beginner", "personal")
-            elif choice == "2":
-                self.practice_conversation("beginner", "situations")
-            elif choice == "3":
-                self.practice_conversation("intermediate")
-            elif choice == "4":
-                self.practice_conversation("advanced")
-            elif choice == "5":
-                self.free_conversation()
-            elif choice == "6":
-                self.pronunciation_drill()
-            elif choice == "7":
-                self.settings_menu()
+            action = self._menu_actions.get(choice)
+            if action:
+                action()
             elif choice == "8":
-                farewell = "Thanks for practicing English speaking with me! Keep up the great work!"
+                self.save_session()
+                farewell = FAREWELL_MESSAGE
                 print(f"🤖 {farewell}")
                 self.speak_text(farewell)
                 break
@@ -723,14 +1679,19 @@ def main():
         print("❌ Cannot connect to Ollama. Please start it with: ollama serve")
         return
     
+    bot.warm_up_model()
     print("✅ Ready for seamless speaking practice!")
     
     # Welcome message
-    welcome = "Welcome to seamless English speaking practice! I'll automatically speak questions and feedback, and show you exactly what I heard you say. Let's start!"
+    welcome = WELCOME_MESSAGE
     print(f"\n🤖 {welcome}")
     bot.speak_text(welcome)
     
     bot.main_menu()
+    
+    # Let the farewell finish before the speech threads exit with the program
+    bot.wait_for_speech()
+    bot.close_microphone()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file